@@ -1,3 +1,21 @@
-from setuptools import setup
+from setuptools import Extension, setup
 
-setup()
+# The compiled move generation is optional: without Cython or
+# a C compiler checkers.game uses the pure Python move generation
+engine = Extension('checkers._engine', ['src/checkers/_engine.pyx'],
+                   optional=True)
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [engine],
+        compiler_directives={'language_level': 3},
+    )
+    # cythonize makes new extensions without the optional flag
+    for ext in ext_modules:
+        ext.optional = True
+
+setup(ext_modules=ext_modules)
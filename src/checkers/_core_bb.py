@@ -0,0 +1,253 @@
+"""This module is the pure Python move generation of the checkers.
+
+Moves are generated from the bitboards of the side to move and its
+opponent (see checkers.board.Board) and packed by the
+checkers.move.pack_move. The compiled checkers._engine module has
+the same gen_moves function and generates the same moves in the same
+order.
+
+This file can also be imported as module and contains the following
+functions:
+
+    * gen_moves - all packed moves for the side to move
+    * beat_sources - bitboard of checkers that can beat
+    * gen_beat_moves_at - beating moves of a single checker
+    * gen_not_beat_moves - all not beating moves
+"""
+
+
+from checkers.board import MoveTables, OPPOSITE
+from checkers.move import SQUARE_BITS, STEPS_SHIFT
+
+
+# Bitmasks of the directions of checkers.board.DIRECTIONS
+# in which a checker can go
+BLACK_DIRS = 0b1100
+WHITE_DIRS = 0b0011
+QUEEN_DIRS = 0b1111
+
+
+def gen_moves(
+        size: int,
+        own_men: int,
+        own_queens: int,
+        opponent: int,
+        black: bool,
+) -> list[int]:
+    """
+    Get the list off all possible packed moves for the side to move
+
+    Parameters
+    ----------
+    size : int
+        number of rows and columns of the board
+    own_men : int
+        bitboard of the men of the side to move
+    own_queens : int
+        bitboard of the queens of the side to move
+    opponent : int
+        bitboard of the opponent's checkers
+    black : bool
+        True if black is the side to move
+
+    Returns
+    -------
+    list[int]
+        list of packed moves, [] if there are no moves
+    """
+
+    tables = MoveTables.get(size)
+    men_dirs = BLACK_DIRS if black else WHITE_DIRS
+    empty = tables.full & ~(own_men | own_queens | opponent)
+
+    moves = []
+    bb = beat_sources(tables, own_men, own_queens, men_dirs, opponent, empty)
+    while bb:
+        lsb = bb & -bb
+        dirs = QUEEN_DIRS if lsb & own_queens else men_dirs
+        gen_beat_moves_at(tables, lsb.bit_length() - 1, dirs, opponent,
+                          empty | lsb, moves)
+        bb ^= lsb
+
+    if not moves:
+        gen_not_beat_moves(tables, own_men, own_queens, men_dirs, empty, moves)
+
+    return moves
+
+
+def beat_sources(
+        tables: MoveTables,
+        men: int,
+        queens: int,
+        men_dirs: int,
+        opponent: int,
+        empty: int,
+) -> int:
+    """
+    Find checkers that can beat an opponent's checker.
+
+    All checkers are checked at once: the bitboard of checkers
+    that can go in a direction is shifted to the jumped cells
+    and then to the landing cells.
+
+    Parameters
+    ----------
+    tables : MoveTables
+        tables of the board
+    men : int
+        bitboard of the men of the side to move
+    queens : int
+        bitboard of the queens of the side to move
+    men_dirs : int
+        bitmask of directions of the men
+    opponent : int
+        bitboard of the opponent's checkers
+    empty : int
+        bitboard of the empty cells
+
+    Returns
+    -------
+    int
+        bitboard of the checkers that have beating moves
+    """
+
+    sources = 0
+    for d, shift in enumerate(tables.shifts):
+        bb = queens | men if men_dirs & 1 << d else queens
+        bb &= tables.jump_from[d]
+        if shift > 0:
+            bb = ((bb << shift & opponent) << shift & empty) >> 2 * shift
+        else:
+            shift = -shift
+            bb = ((bb >> shift & opponent) >> shift & empty) << 2 * shift
+        sources |= bb
+
+    return sources
+
+
+def gen_beat_moves_at(
+        tables: MoveTables,
+        sq: int,
+        dirs: int,
+        opponent: int,
+        empty: int,
+        out: list[int],
+) -> None:
+    """
+    Find all sequences of steps of the checker in the cell sq
+    that beat opponent's checkers and append them to out
+    as packed moves.
+
+    Beating step is a jump through an opponent checker
+    to an empty cell. Sequences are searched depth-first with
+    an explicit stack, a sequence is finished when there is no
+    beating step from its last cell.
+
+    Parameters
+    ----------
+    tables : MoveTables
+        tables of the board
+    sq : int
+        index row * size + col of the cell in the board
+    dirs : int
+        bitmask of possible directions to a move
+    opponent : int
+        bitboard of the opponent's checkers
+    empty : int
+        bitboard of the empty cells, the cell sq must be in it
+    out : list[int]
+        list of packed moves to append to
+
+    Returns
+    -------
+    None
+    """
+
+    beats = tables.beats
+    append = out.append
+    # cell, directions of the next step (turkish hit rule),
+    # bitboard of bet checkers, packed steps and number of steps
+    stack = [(sq, dirs, 0, sq, 0)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        sq, new_dirs, bet, packed, depth = pop()
+        shift = STEPS_SHIFT + SQUARE_BITS * depth
+        # children are pushed onto the stack itself and reversed
+        # in place, so the first one is popped first
+        mark = len(stack)
+        for d, over_bit, land_bit, land in beats[sq]:
+            if not new_dirs & 1 << d or not over_bit & opponent:
+                continue
+            if over_bit & bet:
+                break
+            if land_bit & empty:
+                push((
+                    land, dirs & ~OPPOSITE[d], bet | over_bit,
+                    packed | land << shift, depth + 1
+                ))
+        pushed = len(stack) - mark
+        if pushed > 1:
+            stack[mark:] = stack[mark:][::-1]
+        elif not pushed and depth:
+            append(packed | depth << SQUARE_BITS)
+
+
+def gen_not_beat_moves(
+        tables: MoveTables,
+        men: int,
+        queens: int,
+        men_dirs: int,
+        empty: int,
+        out: list[int],
+) -> None:
+    """
+    Find all not beating moves and append them to out.
+
+    Cells where checkers can step are found at once for every
+    direction by shifting the bitboard of checkers that can go
+    in the direction, then moves are emitted in the order of
+    their start cells and directions.
+
+    Parameters
+    ----------
+    tables : MoveTables
+        tables of the board
+    men : int
+        bitboard of the men of the side to move
+    queens : int
+        bitboard of the queens of the side to move
+    men_dirs : int
+        bitmask of directions of the men
+    empty : int
+        bitboard of the empty cells
+    out : list[int]
+        list of packed moves to append to
+
+    Returns
+    -------
+    None
+    """
+
+    shifts = tables.shifts
+    sources = []
+    movable = 0
+    for d, shift in enumerate(shifts):
+        bb = queens | men if men_dirs & 1 << d else queens
+        bb &= tables.step_from[d]
+        if shift > 0:
+            bb = (bb << shift & empty) >> shift
+        else:
+            bb = (bb >> -shift & empty) << -shift
+        sources.append(bb)
+        movable |= bb
+
+    append = out.append
+    one_step = 1 << SQUARE_BITS
+    while movable:
+        lsb = movable & -movable
+        sq = lsb.bit_length() - 1
+        for d, shift in enumerate(shifts):
+            if sources[d] & lsb:
+                append(sq | one_step | sq + shift << STEPS_SHIFT)
+        movable ^= lsb
@@ -0,0 +1,146 @@
+# cython: language_level=3
+"""This module is a compiled version of the move generation
+of the checkers.game module.
+
+It works with boards up to 8x8, so every bitboard fits in uint64.
+Moves are generated in the same order and packed in the same way
+as the pure Python checkers._core_bb.gen_moves does it.
+
+This file can also be imported as module and contains the following
+functions:
+
+    * gen_moves - all packed moves for the side to move
+"""
+
+from libc.stdint cimport uint64_t
+
+
+# Longest beat sequence can not be longer than number of cells
+cdef enum:
+    MAX_STEPS = 64
+
+# Diagonal directions in the order of checkers.board.DIRECTIONS
+cdef int DROW[4]
+cdef int DCOL[4]
+DROW[:] = [-1, -1, 1, 1]
+DCOL[:] = [-1, 1, -1, 1]
+
+
+cdef inline int _lowest_bit(uint64_t bb):
+    cdef int sq = 0
+    while not (bb >> sq) & 1:
+        sq += 1
+    return sq
+
+
+cdef object _pack(int start, int *path, int n):
+    cdef object packed = start | n << 6
+    cdef int i
+    for i in range(n):
+        packed |= <object>path[i] << (10 + 6 * i)
+    return packed
+
+
+cdef int _dfs(
+        int start,
+        int sq,
+        int size,
+        int dirs,
+        int new_dirs,
+        uint64_t opponent,
+        uint64_t empty,
+        uint64_t bet,
+        int *path,
+        int depth,
+        list out,
+) except -1:
+    cdef int row = sq // size
+    cdef int col = sq % size
+    cdef int d, r, c, land
+    cdef int found = 0
+    cdef uint64_t over_bit
+
+    for d in range(4):
+        r = row + 2 * DROW[d]
+        c = col + 2 * DCOL[d]
+        if r < 0 or r >= size or c < 0 or c >= size:
+            continue
+        over_bit = (<uint64_t>1) << ((row + DROW[d]) * size + col + DCOL[d])
+        if not (new_dirs >> d) & 1 or not over_bit & opponent:
+            continue
+        if over_bit & bet:
+            break
+        land = r * size + c
+        if (<uint64_t>1) << land & empty:
+            found = 1
+            path[depth] = land
+            if not _dfs(start, land, size, dirs, dirs & ~(1 << (3 - d)),
+                        opponent, empty, bet | over_bit,
+                        path, depth + 1, out):
+                out.append(_pack(start, path, depth + 1))
+
+    return found
+
+
+def gen_moves(
+        int size,
+        uint64_t own_men,
+        uint64_t own_queens,
+        uint64_t opponent,
+        bint black,
+) -> list:
+    """
+    Get the list off all possible packed moves for the side to move
+
+    Parameters
+    ----------
+    size : int
+        number of rows and columns of the board, not more than 8
+    own_men : int
+        bitboard of the men of the side to move
+    own_queens : int
+        bitboard of the queens of the side to move
+    opponent : int
+        bitboard of the opponent's checkers
+    black : bool
+        True if black is the side to move
+
+    Returns
+    -------
+    list[int]
+        list of packed moves, [] if there are no moves
+    """
+
+    cdef uint64_t own = own_men | own_queens
+    cdef uint64_t empty = (~(<uint64_t>0) >> (64 - size * size)) \
+        & ~(own | opponent)
+    cdef int man_dirs = 0b1100 if black else 0b0011
+    cdef int path[MAX_STEPS]
+    cdef list out = []
+    cdef list quiet = []
+    cdef uint64_t bb, lsb
+    cdef int sq, dirs, d, r, c, dst
+
+    # one pass over the checkers: beating moves go to out, not beating
+    # moves are collected only until the first beating move is found
+    bb = own
+    while bb:
+        lsb = bb & (~bb + 1)
+        sq = _lowest_bit(lsb)
+        dirs = 0b1111 if lsb & own_queens else man_dirs
+        _dfs(sq, sq, size, dirs, dirs, opponent, empty | lsb, 0,
+             path, 0, out)
+        bb ^= lsb
+        if out:
+            continue
+        for d in range(4):
+            r = sq // size + DROW[d]
+            c = sq % size + DCOL[d]
+            if not (dirs >> d) & 1 \
+                    or r < 0 or r >= size or c < 0 or c >= size:
+                continue
+            dst = r * size + c
+            if (<uint64_t>1) << dst & empty:
+                quiet.append(sq | 1 << 6 | dst << 10)
+
+    return out or quiet
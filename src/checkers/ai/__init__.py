@@ -1,6 +1,6 @@
 """This package represents AI that for English checkers
 
-Each ai object initialized with the size of the board and
-has method make_move. Method make_move takes last of the
-opponent if it was presented and return move.
+Each ai object initialized with its color and
+has method make_move. Method make_move takes the game
+where it is AI's turn and return move.
 """
@@ -1,7 +1,8 @@
 """This module contains class RandomAI
 
 RandomAI just return random move from the moves that
-were returned by the get_all_moves method of the Game.
+were returned by the get_all_moves method of the game
+it plays.
 
 This file can also be imported as module and contains the following
 classes:
@@ -23,62 +24,58 @@ class RandomAI:
 
     Attributes
     ----------
-    _game : Game
-        separate Game object that allows to get all possible moves
     color : Color
         color of AI player
+    _rng : random.Random
+        generator of random numbers of this AI player
 
     Methods
     -------
-    make_move(opponent_move: Move | None = None) -> Move:
-        takes last opponent's move if it was presented
+    make_move(game: Game) -> Move | int:
+        takes the game where it is AI's turn
         and returns randomly chosen move
     """
-    def __init__(self, size: int, color: Color):
+    def __init__(self, color: Color, seed: int | None = None):
         """
-        Creates separate Game object and writes color of AI player
+        Writes color of AI player and creates its own random generator,
+        seed makes the choice of moves reproducible
         """
-        self._game: Game = Game(size)
         self.color: Color = color
+        self._rng: random.Random = random.Random(seed)
 
-    def make_move(self, opponent_move: Move | None = None) -> Move:
+    def make_move(self, game: Game) -> Move | int:
         """
-        takes last opponent's move if it was presented
+        takes the game where it is AI's turn
         and returns randomly chosen move
 
+        The move is not made, the caller makes it on the game.
+
         Parameters
         ----------
-        opponent_move : Move | None, optional
-            last opponent's move if it was presented
+        game : Game
+            game where it is AI's turn
 
         Returns
         -------
-        Move
-            Move is randomly chosen by AI
+        Move | int
+            Move is randomly chosen by AI,
+            packed if game.use_packed
         """
-        if opponent_move is not None:
-            self._game.make_move(opponent_move)
-        moves = self._game.get_all_moves()
-        move = moves[random.randint(0, len(moves) - 1)]
-        self._game.make_move(move)
-
-        return move
+        return self._rng.choice(game.get_all_moves())
 
 
 if __name__ == '__main__':
     size = 8
     game = Game(size)
     ai_color = Color.WHITE
-    ai = RandomAI(size, ai_color)
-    if ai_color == Color.BLACK:
-        move = None
+    ai = RandomAI(ai_color)
     while game.state == GameState.UNFINISHED:
         print(game.board)
         print('b:', game.black_count, 'w:', game.white_count)
         print(game.turn)
 
         if game.turn == ai_color:
-            move = ai.make_move(move)
+            move = ai.make_move(game)
         else:
             moves = game.get_all_moves()
             for i, move in enumerate(moves):
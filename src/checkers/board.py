@@ -1,6 +1,10 @@
 """This module is for representing checkers board.
 
-Class Cell(Enum) describes all possible conditions of the board's cell.
+Class Cell(IntEnum) describes all possible conditions of the board's cell.
+
+Class MoveTables keeps the beats of a checker from every cell
+of the board, the edge masks of the steps and the Zobrist keys
+of the cells precomputed once for the board size.
 
 Class Board is to represent and initially fill the board and allow to
 read and set cell values.
@@ -8,43 +12,192 @@ read and set cell values.
 This file can also be imported as module and contains the following
 classes:
 
-    * Cell - Enum that represents cell values
+    * Cell - IntEnum that represents cell values
+    * MoveTables - precomputed beats and Zobrist keys for every cell
+      and edge masks of the steps
     * Board - represent checkers board
 """
 
 
-from enum import Enum
+from __future__ import annotations
+
+import random
+from enum import Enum, IntEnum
+
+
+# Diagonal directions (row, col) of a step. A set of directions is
+# a bitmask where the direction DIRECTIONS[d] is the bit 1 << d.
+DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+# OPPOSITE[d] is the bit of the direction opposite to DIRECTIONS[d].
+OPPOSITE = (1 << 3, 1 << 2, 1 << 1, 1 << 0)
 
 
-class Cell(Enum):
+class Cell(IntEnum):
     EMPTY = 0
     BLACK = 1
     WHITE = 2
     BLACK_QUEEN = 3
     WHITE_QUEEN = 4
 
+    # print cells as Cell.BLACK, not as ints
+    __str__ = Enum.__str__
+
+
+class MoveTables:
+    """
+    A class to keep beats of a checker from every cell of the board
+    (size)x(size) and the masks of cells from which a step stays on
+    the board. Cells are indexed as row * size + col, all
+    destinations are on the board.
+
+    ...
+
+    Attributes
+    ----------
+    beats : list[tuple[tuple[int, int, int, int], ...]]
+        beats[sq] is a tuple of (direction, over_bit, land_bit, land)
+        for every direction of DIRECTIONS in which a checker from
+        the cell sq can jump over the cell over_bit to the cell land
+    zobrist : list[list[int]]
+        zobrist[cell][sq] is a random 64-bit key of the checker
+        cell in the cell sq, keys of Cell.EMPTY are zeros
+    full : int
+        bitboard of all cells of the board
+    dark : int
+        bitboard of the black (playable) cells
+    shifts : tuple[int, ...]
+        shifts[d] is the change of the cell index after the step
+        in the direction DIRECTIONS[d]
+    step_from : list[int]
+        step_from[d] is a bitboard of cells from which a step
+        in the direction DIRECTIONS[d] stays on the board
+    jump_from : list[int]
+        jump_from[d] is a bitboard of cells from which a jump
+        in the direction DIRECTIONS[d] lands on the board
+
+    Methods
+    -------
+    get(size: int) -> MoveTables:
+        Get the tables for the board (size)x(size).
+    """
+
+    _cache: dict[int, MoveTables] = {}
+
+    def __init__(self, size: int):
+        """
+        Calculate the tables for the board (size)x(size).
+        """
+
+        self.beats: list[tuple[tuple[int, int, int, int], ...]] = []
+        self.full: int = (1 << size * size) - 1
+        self.dark: int = 0
+        self.shifts: tuple[int, ...] = tuple(
+            size * rdir + cdir for rdir, cdir in DIRECTIONS)
+        self.step_from: list[int] = [0] * len(DIRECTIONS)
+        self.jump_from: list[int] = [0] * len(DIRECTIONS)
+
+        for row in range(size):
+            for col in range(size):
+                sq = row * size + col
+                if row % 2 != col % 2:
+                    self.dark |= 1 << sq
+                beats = []
+                for d, (rdir, cdir) in enumerate(DIRECTIONS):
+                    r, c = row + rdir, col + cdir
+                    if not 0 <= r < size or not 0 <= c < size:
+                        continue
+                    bit = 1 << (r * size + c)
+                    self.step_from[d] |= 1 << sq
+
+                    r, c = r + rdir, c + cdir
+                    if 0 <= r < size and 0 <= c < size:
+                        land = r * size + c
+                        beats.append((d, bit, 1 << land, land))
+                        self.jump_from[d] |= 1 << sq
+                self.beats.append(tuple(beats))
+
+        rng = random.Random(size)
+        self.zobrist: list[list[int]] = [[0] * (size * size)]
+        for _ in range(len(Cell) - 1):
+            self.zobrist.append(
+                [rng.getrandbits(64) for _ in range(size * size)])
+
+    @classmethod
+    def get(cls, size: int) -> MoveTables:
+        """
+        Get the tables for the board (size)x(size).
+        Tables are calculated once for every size.
+
+        Parameters
+        ----------
+        size : int
+            number of rows and columns of the board
+
+        Returns
+        -------
+        MoveTables
+        """
+
+        tables = cls._cache.get(size)
+        if tables is None:
+            tables = cls._cache[size] = cls(size)
+        return tables
+
 
 class Board:
     """
-    A class to represent checkers board (SIZE)x(SIZE)
+    A class to represent checkers board (size)x(size)
+
+    Size can not be more than SIZE, so every cell index fits in 6 bits
+    of a packed move (see the checkers.move module).
+
+    Each kind of checkers is kept in its own bitboard: an int where
+    the bit with index row * size + col is set if there is a checker
+    of that kind in the cell with coords row and col.
 
     ...
 
     Attributes
     ----------
-    _board : list[list[type[Cell]]]
-        board is a matrix of Cells
-    board_state : type[BoardState]
-        current state of the game
+    size : int
+        number of rows and columns of the board
+    tables : MoveTables
+        precomputed moves for the board size
+    black_men : int
+        bitboard of the black men
+    black_queens : int
+        bitboard of the black queens
+    white_men : int
+        bitboard of the white men
+    white_queens : int
+        bitboard of the white queens
+    hash : int
+        Zobrist hash of the checkers on the board, it is kept
+        up to date by fill_initial, clear and set_cell
 
     Methods
     -------
+    blank(size: int) -> Board:
+        Create the board without checkers.
     fill_initial():
-        fill the _board by Cell.BLACK and Cell.WHITE.
+        fill the board by Cell.BLACK and Cell.WHITE.
+    clear():
+        remove all checkers from the board.
     get_cell(row: int, col: int) -> Cell:
         Getter of cell with coords row and col.
     set_cell(row: int, col: int, cell: Cell) -> None:
         Set cell value with coords row and col.
+    black() -> int:
+        Bitboard of all black checkers.
+    white() -> int:
+        Bitboard of all white checkers.
+    occupied() -> int:
+        Bitboard of all checkers.
+    empty() -> int:
+        Bitboard of all empty cells.
+
+    Boards are equal when they have the same size and the same
+    checkers in the same cells.
     """
 
     SIZE = 8
@@ -53,14 +206,64 @@ class Board:
         """
         Set the board arrangenment in accordance with
         rules of English chekers.
+
+        Size 0 means the default size Board.SIZE.
+
+        Raises
+        ------
+        ValueError
+            when size is not between 0 and Board.SIZE
         """
 
-        self.size = Board.SIZE
-        if size != 0:
-            self.size = size
-        self._board = [[Cell.EMPTY] * Board.SIZE for i in range(Board.SIZE)]
+        self._set_size(size)
+        self.clear()
         self.fill_initial()
 
+    @classmethod
+    def blank(cls, size: int = 0) -> Board:
+        """
+        Create the board (size)x(size) without checkers,
+        the initial arrangement is not filled.
+
+        Size 0 means the default size Board.SIZE.
+
+        Parameters
+        ----------
+        size : int
+            number of rows and columns of the board
+
+        Returns
+        -------
+        Board
+
+        Raises
+        ------
+        ValueError
+            when size is not between 0 and Board.SIZE
+        """
+
+        board = cls.__new__(cls)
+        board._set_size(size)
+        board.clear()
+
+        return board
+
+    def _set_size(self, size: int) -> None:
+        """
+        Set the size and the tables of the board.
+
+        Raises
+        ------
+        ValueError
+            when size is not between 0 and Board.SIZE
+        """
+
+        if not 0 <= size <= Board.SIZE:
+            raise ValueError(f'size must be between 0 and {Board.SIZE}.')
+
+        self.size = size or Board.SIZE
+        self.tables = MoveTables.get(self.size)
+
     def fill_initial(self):
         """
         Fill the board 8x8 (example) by chekers:
@@ -82,15 +285,51 @@ class Board:
         'w' is a black cell with th white cheker.
         """
 
-        for row in range(self.size // 2 - 1 + self.size % 2):
-            for col in range(self.size):
-                if row % 2 != col % 2:
-                    self._board[row][col] = Cell.BLACK
+        size = self.size
+        dark = self.tables.dark
+        black_rows = size // 2 - 1 + size % 2
+        self.black_men = dark & ((1 << black_rows * size) - 1)
+        self.white_men = dark & -(1 << (size // 2 + 1) * size)
+        self.hash = self._zobrist_hash()
 
-        for row in range(self.size // 2 + 1, self.size):
-            for col in range(self.size):
-                if row % 2 != col % 2:
-                    self._board[row][col] = Cell.WHITE
+    def clear(self) -> None:
+        """
+        Remove all checkers from the board.
+
+        Returns
+        -------
+        None
+        """
+
+        self.black_men = 0
+        self.black_queens = 0
+        self.white_men = 0
+        self.white_queens = 0
+        self.hash = 0
+
+    def _zobrist_hash(self) -> int:
+        """
+        Calculate Zobrist hash of the checkers on the board
+        from scratch.
+
+        Returns
+        -------
+        int
+        """
+
+        zobrist = self.tables.zobrist
+        h = 0
+        for cell, bb in ((Cell.BLACK, self.black_men),
+                         (Cell.WHITE, self.white_men),
+                         (Cell.BLACK_QUEEN, self.black_queens),
+                         (Cell.WHITE_QUEEN, self.white_queens)):
+            keys = zobrist[cell]
+            while bb:
+                lsb = bb & -bb
+                h ^= keys[lsb.bit_length() - 1]
+                bb ^= lsb
+
+        return h
 
     def get_cell(self, row: int, col: int) -> Cell:
         """
@@ -116,9 +355,18 @@ class Board:
 
         if not 0 <= row < self.size or not 0 <= col < self.size:
             raise IndexError('row and col indices must be '
-                             f'between 0 and {Board.SIZE - 1}.')
+                             f'between 0 and {self.size - 1}.')
 
-        return self._board[row][col]
+        bit = 1 << (row * self.size + col)
+        if self.black_men & bit:
+            return Cell.BLACK
+        if self.white_men & bit:
+            return Cell.WHITE
+        if self.black_queens & bit:
+            return Cell.BLACK_QUEEN
+        if self.white_queens & bit:
+            return Cell.WHITE_QUEEN
+        return Cell.EMPTY
 
     def set_cell(self, row: int, col: int, cell: Cell) -> None:
         """
@@ -147,7 +395,60 @@ class Board:
             raise IndexError('row and col indices must be '
                              f'between 0 and {self.size - 1}.')
 
-        self._board[row][col] = cell
+        sq = row * self.size + col
+        bit = 1 << sq
+        zobrist = self.tables.zobrist
+        self.hash ^= zobrist[cell][sq]
+        if self.black_men & bit:
+            self.black_men ^= bit
+            self.hash ^= zobrist[Cell.BLACK][sq]
+        elif self.white_men & bit:
+            self.white_men ^= bit
+            self.hash ^= zobrist[Cell.WHITE][sq]
+        elif self.black_queens & bit:
+            self.black_queens ^= bit
+            self.hash ^= zobrist[Cell.BLACK_QUEEN][sq]
+        elif self.white_queens & bit:
+            self.white_queens ^= bit
+            self.hash ^= zobrist[Cell.WHITE_QUEEN][sq]
+
+        if cell == Cell.BLACK:
+            self.black_men |= bit
+        elif cell == Cell.WHITE:
+            self.white_men |= bit
+        elif cell == Cell.BLACK_QUEEN:
+            self.black_queens |= bit
+        elif cell == Cell.WHITE_QUEEN:
+            self.white_queens |= bit
+
+    def black(self) -> int:
+        """
+        Bitboard of all black checkers (men and queens).
+        """
+
+        return self.black_men | self.black_queens
+
+    def white(self) -> int:
+        """
+        Bitboard of all white checkers (men and queens).
+        """
+
+        return self.white_men | self.white_queens
+
+    def occupied(self) -> int:
+        """
+        Bitboard of all checkers on the board.
+        """
+
+        return self.black_men | self.black_queens \
+            | self.white_men | self.white_queens
+
+    def empty(self) -> int:
+        """
+        Bitboard of all empty cells of the board.
+        """
+
+        return self.tables.full & ~self.occupied()
 
     def __str__(self) -> str:
         """
@@ -170,19 +471,45 @@ class Board:
             Cell.WHITE_QUEEN: 'W ',
         }
 
-        s = '|' + '--' * self.size + '|\n'
-        for row in range(self.size):
-            s += '|'
-            for col in range(self.size):
-                cell = self.get_cell(row, col)
-                if cell == Cell.EMPTY:
-                    s += cell_to_str[cell][(row + col) % 2]
+        size = self.size
+        get_cell = self.get_cell
+        empty = Cell.EMPTY
+        border = '|' + '--' * size + '|\n'
+
+        parts = [border]
+        for row in range(size):
+            parts.append('|')
+            for col in range(size):
+                cell = get_cell(row, col)
+                if cell == empty:
+                    parts.append(cell_to_str[cell][(row + col) % 2])
                 else:
-                    s += cell_to_str[cell]
-            s += '|\n'
-        s += '|' + '--' * self.size + '|\n'
+                    parts.append(cell_to_str[cell])
+            parts.append('|\n')
+        parts.append(border)
+
+        return ''.join(parts)
+
+    def __repr__(self) -> str:
+        """
+        Representation of the board: its size and the table of __str__.
+        """
+
+        return f'Board({self.size})\n{self}'
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Boards are equal when they have the same size
+        and the same checkers in the same cells.
+        """
 
-        return s
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self.size == other.size \
+            and self.black_men == other.black_men \
+            and self.black_queens == other.black_queens \
+            and self.white_men == other.white_men \
+            and self.white_queens == other.white_queens
 
 
 if __name__ == '__main__':
@@ -7,29 +7,68 @@ and cancel moves (with previous game state recovery).
 This file can also be imported as module and contains the following
 classes:
 
-    * GameState - (Enum) describes all possible states of the game
+    * GameState - (IntEnum) describes all possible states of the game
     * Color - represents player's color ( side in the game).
     * Game - represent a simulation of the game.
 """
 
 
-from enum import Enum
-
-from checkers.board import Board, Cell
-from checkers.move import Move, WrongMoveError
+from __future__ import annotations
 
+import random
+from enum import Enum, IntEnum
 
-class GameState(Enum):
+from checkers import _core_bb
+from checkers.board import Board, Cell
+from checkers.move import (
+    Move,
+    WrongMoveError,
+    is_beat,
+    unpack_len,
+    unpack_start,
+    unpack_step,
+)
+
+try:
+    from checkers import _engine
+except ImportError:
+    # the compiled move generation is not built,
+    # moves are generated by the pure Python code below
+    _engine = None
+
+
+# Cells indexed by their values
+_CELLS = tuple(Cell)
+
+# Number of black and white checkers in the cell, indexed by Cell
+_BLACK_DELTA = (0, 1, 0, 1, 0)
+_WHITE_DELTA = (0, 0, 1, 0, 1)
+
+# Zobrist key of the white's turn, it is xored with the board hash
+ZOBRIST_WHITE_TURN = random.Random(0).getrandbits(64)
+# Maximum number of positions in the cache of the generated moves,
+# the least recently used position is dropped when it is full
+MOVES_CACHE_SIZE = 1 << 16
+_moves_cache: dict[tuple[int, int], tuple[int, ...]] = {}
+
+
+class GameState(IntEnum):
     TIE = 0
     BLACK_WON = 1
     WHITE_WON = 2
     UNFINISHED = 3
 
+    # print states as GameState.TIE, not as ints
+    __str__ = Enum.__str__
+
 
-class Color(Enum):
+class Color(IntEnum):
     BLACK = 1
     WHITE = 2
 
+    # print colors as Color.BLACK, not as ints
+    __str__ = Enum.__str__
+
 
 class Game:
     """
@@ -45,9 +84,11 @@ class Game:
         current state of the game
     turn : Color
         Color of the chekers that have to go next
-    last_changes : list[list[tuple[int, int, Cell]]]
-        Last item is a tuple of row, column and initial value of the cell
-        that was changed last. Previous item - last before last and so on.
+    _undo_buf : bytearray
+        Undo log, a pair of bytes for every changed cell: its index
+        row * size + col and the Cell it had before the change
+    _undo_ends : list[int]
+        Length of the _undo_buf before every made move
     black_count : int
         Number of black checkers on the board
     white_count : int
@@ -58,39 +99,113 @@ class Game:
     tie_max : int
         Maximum value of the tie_counter
         If tie_counter == tie_max then game finishes with the tie
+    use_packed : bool
+        If True get_all_moves and make_move work with packed moves
+        (see checkers.move.pack_move) instead of Move objects
+    _cached_key : int | None
+        Zobrist key of the position the _cached_moves were generated for
+    _cached_moves : tuple[int, ...]
+        packed moves of the last position get_all_packed_moves was
+        called for
 
     Methods
     -------
+    from_board(board: Board, turn: Color, state: GameState,
+               use_packed: bool) -> Game:
+        Create the game on the given board
     opponent() -> Color:
         Get the opponent of the current Color
-    get_all_moves() -> list[Move]:
+    get_all_moves() -> list[Move] | list[int]:
+        Get the list off all possible moves for current turn
+    get_all_packed_moves() -> list[int]:
         Get the list off all possible moves for current turn
-    make_move(self, move: Move) -> None:
+        packed into ints
+    make_move(self, move: Move | int) -> None:
         Make a move and set board to the next turn
+    make_packed_move(self, packed: int) -> None:
+        Make a packed move and set board to the next turn
     undo() -> None:
         Cancels last move and recover previous state and board
     """
 
-    def __init__(self, size: int = 0):
+    def __init__(self, size: int = 0, use_packed: bool = False):
         """
         Creating a board. Black goes first.
+
+        With use_packed moves of get_all_moves and make_move are
+        packed ints, so no Move objects are created.
+        """
+
+        self._set_up(Board(size), Color.BLACK, GameState.UNFINISHED,
+                     use_packed)
+
+    @classmethod
+    def from_board(
+            cls,
+            board: Board,
+            turn: Color = Color.BLACK,
+            state: GameState = GameState.UNFINISHED,
+            use_packed: bool = False,
+    ) -> Game:
+        """
+        Create the game on the given board without the initial
+        arrangement. Checkers counters are counted on the board.
+
+        Parameters
+        ----------
+        board : Board
+            board of the game, it is not copied
+        turn : Color
+            Color of the chekers that have to go next
+        state : GameState
+            state of the game
+        use_packed : bool
+            see Game.__init__
+
+        Returns
+        -------
+        Game
+
+        Raises
+        ------
+        ValueError
+            when turn is not a Color or state is not a GameState
+        """
+
+        game = cls.__new__(cls)
+        game._set_up(board, Color(turn), GameState(state), use_packed)
+        return game
+
+    def _set_up(
+            self,
+            board: Board,
+            turn: Color,
+            state: GameState,
+            use_packed: bool,
+    ) -> None:
+        """
+        Set all attributes of the game on the board.
         """
 
-        self.board: Board = Board(size)
-        self.state: GameState = GameState.UNFINISHED
-        self.turn: Color = Color.BLACK
-        self.last_changes: list[list[tuple[int, int, Cell]]] = []
+        self.board: Board = board
+        self.state: GameState = state
+        self.turn: Color = turn
+        self._undo_buf: bytearray = bytearray()
+        self._undo_ends: list[int] = []
         self.black_count: int = self._initial_black_count()
-        self.white_count: int = self.black_count
+        self.white_count: int = self.board.white().bit_count()
         self.tie_counter: int = 0
-        self.tie_max: int = size * size // 2
+        self.tie_max: int = self.board.size * self.board.size // 2
+        self.use_packed: bool = use_packed
+        self._cached_key: int | None = None
+        self._cached_moves: tuple[int, ...] = ()
 
     def _initial_black_count(self) -> int:
         """
         Calculate the initial number of black checkers
 
-        Checkers fill all rows despite one in case size is odd
-        or despite two in case size is even
+        It is the number of set bits in the bitboard
+        of the black checkers.
 
         Returns
         -------
@@ -98,11 +213,7 @@ class Game:
             number of black checkers at the start of the game
         """
 
-        size = self.board.size
-        bc = (size // 2 - 1 + size % 2) * (size // 2)
-        bc += (size // 2 - 1 + size % 2) // 2 * int(size % 2)
-
-        return bc
+        return self.board.black().bit_count()
 
     def undo(self) -> None:
         """
@@ -113,16 +224,20 @@ class Game:
         None
         """
 
-        if self.last_changes:
+        if self._undo_ends:
             self.state = GameState.UNFINISHED
-            changes: list[tuple[int, int, Cell]] = self.last_changes.pop()
-            while changes:
-                row, col, cell = changes.pop()
-                self._set_cell_undo(row, col, cell)
+            start = self._undo_ends.pop()
+            buf = self._undo_buf
+            size = self.board.size
+            set_cell_undo = self._set_cell_undo
+            for i in range(len(buf) - 2, start - 2, -2):
+                row, col = divmod(buf[i], size)
+                set_cell_undo(row, col, _CELLS[buf[i + 1]])
+            del buf[start:]
 
     def _set_cell(self, row: int, col: int, cell: Cell) -> None:
         """
-        Call the board.set_cell method, update last_changes,
+        Call the board.set_cell method, update the undo log,
         update black_count and white_count.
 
         Parameters
@@ -139,9 +254,10 @@ class Game:
         None
         """
 
-        prev_cell = self.board.get_cell(row, col)
-        self.last_changes[-1].append((row, col, prev_cell))
-        self.board.set_cell(row, col, cell)
+        board = self.board
+        prev_cell = board.get_cell(row, col)
+        self._undo_buf += bytes((row * board.size + col, prev_cell))
+        board.set_cell(row, col, cell)
 
         self._update_checkers_counters(prev_cell, cell)
 
@@ -164,10 +280,11 @@ class Game:
         None
         """
 
-        prev_cell = self.board.get_cell(row, col)
+        board = self.board
+        prev_cell = board.get_cell(row, col)
         if self.tie_counter > 0:
             self.tie_counter -= 1
-        self.board.set_cell(row, col, cell)
+        board.set_cell(row, col, cell)
 
         self._update_checkers_counters(prev_cell, cell)
 
@@ -187,15 +304,8 @@ class Game:
         None
         """
 
-        if prev_cell in (Cell.BLACK, Cell.BLACK_QUEEN):
-            self.black_count -= 1
-        if prev_cell in (Cell.WHITE, Cell.WHITE_QUEEN):
-            self.white_count -= 1
-
-        if cell in (Cell.BLACK, Cell.BLACK_QUEEN):
-            self.black_count += 1
-        if cell in (Cell.WHITE, Cell.WHITE_QUEEN):
-            self.white_count += 1
+        self.black_count += _BLACK_DELTA[cell] - _BLACK_DELTA[prev_cell]
+        self.white_count += _WHITE_DELTA[cell] - _WHITE_DELTA[prev_cell]
 
     def _update_state(self) -> None:
         """
@@ -205,13 +315,19 @@ class Game:
         else the state does not change.
         """
 
-        if self.tie_counter >= self.tie_max:
+        if self.turn == Color.BLACK:
+            count, won = self.black_count, GameState.WHITE_WON
+        else:
+            count, won = self.white_count, GameState.BLACK_WON
+
+        # a side without checkers can not move, the moves are not
+        # generated then (a tie is impossible right after a beat)
+        if not count:
+            self.state = won
+        elif self.tie_counter >= self.tie_max:
             self.state = GameState.TIE
-        elif not self.get_all_moves():
-            if self.turn == Color.BLACK:
-                self.state = GameState.WHITE_WON
-            else:
-                self.state = GameState.BLACK_WON
+        elif not self.get_all_packed_moves():
+            self.state = won
 
     def opponent(self) -> Color:
         """
@@ -226,486 +342,299 @@ class Game:
             return Color.WHITE
         return Color.BLACK
 
-    def make_move(self, move: Move) -> None:
+    def make_move(self, move: Move | int) -> None:
         """
         Make a move and set board to the next turn
 
         Parameters
         ----------
-        move : Move
+        move : Move | int
+            Move, or packed move if self.use_packed
 
         Returns
         -------
         None
-        """
-
-        if len(move.steps) == 1:
-            first_step_len = abs(max(move.steps[0][0] - move.start[0],
-                                     move.steps[0][1] - move.start[1]))
-
-        self.tie_counter += 1
-        self.last_changes.append([])
-        if len(move.steps) == 1 and first_step_len == 1:
-            self._make_one_step_move(move)
-        else:
-            self._make_beat_move(move)
-            self.tie_counter = 0
-        self._check_and_change_to_queen(move)
 
-        self.turn = self.opponent()
-        self._update_state()
-
-    def _make_one_step_move(self, move: Move) -> None:
+        Raises
+        ------
+        WrongMoveError
+            when the move does not start from a checker of self.turn,
+            has no steps or has a step out of the board
         """
-        Make a one step move
 
-        Parameters
-        ----------
-        move : Move
+        size = self.board.size
+        if self.use_packed:
+            packed = move
+            start = divmod(unpack_start(packed), size)
+            steps = [
+                divmod(unpack_step(packed, i), size)
+                for i in range(unpack_len(packed))
+            ]
+        else:
+            start = move.start
+            steps = list(move)
 
-        Returns
-        -------
-        None
-        """
+        self._is_correct_cell_for_move(*start)
+        if not steps:
+            raise WrongMoveError('move must have at least one step')
+        for row, col in steps:
+            if not 0 <= row < size or not 0 <= col < size:
+                raise WrongMoveError('row and col of the steps must be in '
+                                     'the range(self.board.size)')
 
-        row, col = move.steps[0]
-        start_row, start_col = move.start
-        cell = self.board.get_cell(start_row, start_col)
-        self._set_cell(row, col, cell)
-        self._set_cell(start_row, start_col, Cell.EMPTY)
+        if not self.use_packed:
+            packed = move.to_packed(size)
+        self.make_packed_move(packed)
 
-    def _make_beat_move(self, move: Move) -> None:
+    def make_packed_move(self, packed: int) -> None:
         """
-        Make a beating move
+        Make a packed move and set board to the next turn
 
         Parameters
         ----------
-        move : Move
+        packed : int
+            move packed by the checkers.move.pack_move
 
         Returns
         -------
         None
         """
 
-        prev_row, prev_col = move.start
-        prev_cell = self.board.get_cell(prev_row, prev_col)
-        for step in move:
-            row, col = step
-            self._set_cell(
-                (prev_row + row) // 2,
-                (prev_col + col) // 2,
-                Cell.EMPTY)
-            self._set_cell(prev_row, prev_col, Cell.EMPTY)
-            self._set_cell(row, col, prev_cell)
-            prev_row, prev_col = row, col
+        self.tie_counter += 1
+        self._undo_ends.append(len(self._undo_buf))
+        if is_beat(packed, self.board.size):
+            self._make_beat_move(packed)
+            self.tie_counter = 0
+        else:
+            self._make_one_step_move(packed)
 
-    def _check_and_change_to_queen(self, move: Move) -> None:
+        self.turn = self.opponent()
+        self._update_state()
+
+    def _make_one_step_move(self, packed: int) -> None:
         """
-        Change checker to queen if last step in the move
-        is the first or the last row in the board
+        Make a one step move, the checker becomes a queen
+        if it gets to the last row for it
 
         Parameters
         ----------
-        move : Move
+        packed : int
+            packed move
 
         Returns
         -------
         None
         """
 
-        last_row, last_col = move.steps[-1]
-        if self.turn == Color.BLACK and last_row == self.board.size - 1:
-            self._set_cell(last_row, last_col, Cell.BLACK_QUEEN)
-        elif self.turn == Color.WHITE and last_row == 0:
-            self._set_cell(last_row, last_col, Cell.WHITE_QUEEN)
-
-    def _is_turns_checker(self, cell: Cell) -> bool:
-        """
-        Check if the cell's checker belong to self.turn
-
-        Returns
-        -------
-        bool
-        """
-
-        return (cell == Cell.BLACK or cell == Cell.BLACK_QUEEN) \
-            and self.turn == Color.BLACK \
-            or (cell == Cell.WHITE or cell == Cell.WHITE_QUEEN) \
-            and self.turn == Color.WHITE
-
-    def get_all_moves(self) -> list[Move]:
-        """
-        Get the list off all possible moves for current turn
-
-        Returns
-        -------
-        list[Move]
-            list consist of the all possible moves for current turn,
-            [] if there are no moves
-        """
-
-        moves = []
-        for row in range(self.board.size):
-            for col in range(self.board.size):
-                try:
-                    moves += self._get_beat_moves(row, col)
-                except WrongMoveError:
-                    continue
-
-        if moves:
-            return moves
-
-        for row in range(self.board.size):
-            for col in range(self.board.size):
-                try:
-                    moves += self._get_not_beat_moves(row, col)
-                except WrongMoveError:
-                    continue
-
-        return moves
+        size = self.board.size
+        set_cell = self._set_cell
+        row, col = divmod(unpack_step(packed, 0), size)
+        start_row, start_col = divmod(unpack_start(packed), size)
+        set_cell(row, col, self.board.get_cell(start_row, start_col))
+        set_cell(start_row, start_col, Cell.EMPTY)
+        if self.turn == Color.BLACK:
+            if row == size - 1:
+                set_cell(row, col, Cell.BLACK_QUEEN)
+        elif row == 0:
+            set_cell(row, col, Cell.WHITE_QUEEN)
 
-    def _is_correct_cell_for_move(self, row: int, col: int) -> None:
+    def _make_beat_move(self, packed: int) -> None:
         """
-        If row or col are incorrect indices or checker in the cell
-        is not current turn's checker raises WrongMoveError.
+        Make a beating move, the checker becomes a queen
+        if it finishes the move in the last row for it
 
         Parameters
         ----------
-        row : int
-            0-indexed row number in the board
-        col : int
-            0-indexed column number in the board
+        packed : int
+            packed move
 
         Returns
         -------
         None
-
-        Raises
-        ------
-        WrongMoveError
-            when cell type does not correspond to turn or
-            row or col out of range(board.size)
         """
 
-        if not 0 <= row < self.board.size \
-                or not 0 <= col < self.board.size:
-            raise WrongMoveError('row and col must be in the'
-                                 'range(self.board.size)')
+        size = self.board.size
+        set_cell = self._set_cell
+        empty = Cell.EMPTY
+        prev = unpack_start(packed)
+        prev_row, prev_col = divmod(prev, size)
+        prev_cell = self.board.get_cell(prev_row, prev_col)
+        for i in range(unpack_len(packed)):
+            sq = unpack_step(packed, i)
+            row, col = divmod(sq, size)
+            # the bet checker is in the middle of the jump
+            set_cell(*divmod((prev + sq) >> 1, size), empty)
+            set_cell(prev_row, prev_col, empty)
+            set_cell(row, col, prev_cell)
+            prev, prev_row, prev_col = sq, row, col
 
-        cell = self.board.get_cell(row, col)
-        if not self._is_turns_checker(cell):
-            raise WrongMoveError('cell type does not correspond turn\'s color')
+        if self.turn == Color.BLACK:
+            if row == size - 1:
+                set_cell(row, col, Cell.BLACK_QUEEN)
+        elif row == 0:
+            set_cell(row, col, Cell.WHITE_QUEEN)
 
-    def _get_beat_moves(self, row: int, col: int) -> list[Move]:
+    def _own(self) -> int:
         """
-        Find all beating moves for checker with coordinates row and col.
-
-        Parameters
-        ----------
-        row : int
-            0-indexed row number in the board
-        col : int
-            0-indexed column number in the board
+        Bitboard of the checkers of self.turn
 
         Returns
         -------
-        list[Move]
-            list of possible moves for checker
-            [] if there is no moves
-
-        Raises
-        ------
-        WrongMoveError
-            when cell type does not correspond to turn or
-            row or col out of range(board.size)
+        int
         """
 
-        try:
-            self._is_correct_cell_for_move(row, col)
-        except WrongMoveError as e:
-            raise e
-
-        moves = []
-        for step_sequence in self._get_beat_steps(row, col):
-            moves.append(Move((row, col), step_sequence))
-
-        return moves
+        if self.turn == Color.BLACK:
+            return self.board.black()
+        return self.board.white()
 
-    def _get_not_beat_moves(self, row: int, col: int) -> list[Move]:
+    def _opponent(self) -> int:
         """
-        Find all not beating moves for checker with coordinates row and col.
-
-        Parameters
-        ----------
-        row : int
-            0-indexed row number in the board
-        col : int
-            0-indexed column number in the board
+        Bitboard of the checkers of the opponent of self.turn
 
         Returns
         -------
-        list[Move]
-            list of possible moves for checker
-            [] if there is no moves
-
-        Raises
-        ------
-        WrongMoveError
-            when cell type does not correspond to turn or
-            row or col out of range(board.size)
+        int
         """
 
-        try:
-            self._is_correct_cell_for_move(row, col)
-        except WrongMoveError as e:
-            raise e
-
-        moves = []
-        for step_sequence in self._get_not_beat_steps(row, col):
-            moves.append(Move((row, col), step_sequence))
-
-        return moves
+        if self.turn == Color.BLACK:
+            return self.board.white()
+        return self.board.black()
 
-    def _cell_with_opponent(self, row: int, col: int) -> bool:
+    def _own_by_type(self) -> tuple[int, int]:
         """
-        Check if the cell with opponent checker.
-
-        Parameters
-        ----------
-        row : int
-            0-indexed row number in the board
-        col : int
-            0-indexed column number in the board
+        Bitboards of the men and the queens of self.turn
 
         Returns
         -------
-        bool
+        tuple[int, int]
         """
 
-        try:
-            cell = self.board.get_cell(row, col)
-        except IndexError:
-            return False
-
-        if self.turn == Color.BLACK \
-                and cell in (Cell.WHITE, Cell.WHITE_QUEEN):
-            return True
-        if self.turn == Color.WHITE \
-                and cell in (Cell.BLACK, Cell.BLACK_QUEEN):
-            return True
-        return False
+        board = self.board
+        if self.turn == Color.BLACK:
+            return board.black_men, board.black_queens
+        return board.white_men, board.white_queens
 
-    def _empty_cell(self, row: int, col: int) -> bool:
+    def _is_turns_checker(self, bit: int) -> bool:
         """
-        Check if the cell is empty.
+        Check if the checker in the cell with the bit belongs to self.turn
 
         Parameters
         ----------
-        row : int
-            0-indexed row number in the board
-        col : int
-            0-indexed column number in the board
+        bit : int
+            bitboard with the single cell
 
         Returns
         -------
         bool
         """
 
-        try:
-            cell = self.board.get_cell(row, col)
-        except IndexError:
-            return False
+        return bool(self._own() & bit)
 
-        return cell == Cell.EMPTY
-
-    def _dfs_find_beat_steps(
-            self,
-            row: int,
-            col: int,
-            dirs: list[tuple[int, int]],
-            new_dirs: list[tuple[int, int]],
-            bet: set[tuple[int, int]] | None = set(),
-    ) -> list[list[tuple[int, int]]]:
+    def get_all_moves(self) -> list[Move] | list[int]:
         """
-        Find all steps that beat opponent's checkers
-
-        Beating step is a jump through an opponent checker
-        to an empty cell.
-
-        Parameters
-        ----------
-        row : int
-            0-indexed row number in the board
-        col : int
-            0-indexed column numer in the board
-        dirs : list[tuple[int, int]]
-            list of possible directions to a move
-        dirs : list[tuple[int, int]]
-            list of possible directions to a next step of the move
-            (turkish hit rule)
-        bet : set[tuple[int, int]], optional
-            set of cells with bet checkers
-
-        Returns
-        -------
-        list[list[tuple[int, int]]]
-            list of lists of steps for each possible move
-        """
-
-        steps = []
-        cached_cell = self.board.get_cell(row, col)
-        self.board.set_cell(row, col, Cell.EMPTY)
-        for rdir, cdir in new_dirs:
-            r, c = row + rdir, col + cdir
-            if self._cell_with_opponent(r, c):
-                if (r, c) in bet:
-                    break
-                bet.add((r, c))
-                r, c = r + rdir, c + cdir
-                if self._empty_cell(r, c):
-                    next_new_dirs = []
-                    next_steps = []
-                    for d in dirs:
-                        if not (d[0] == -rdir and d[1] == -cdir):
-                            next_new_dirs.append(d)
-                    next_steps = self._dfs_find_beat_steps(
-                        r, c, dirs, next_new_dirs, bet
-                    )
-                    tmp = [(r, c)]
-                    if not next_steps:
-                        steps += [tmp]
-                    for step in next_steps:
-                        steps.append(tmp + step)
-                bet.remove((r - rdir, c - cdir))
-        self.board.set_cell(row, col, cached_cell)
-
-        return steps
-
-    def _find_not_beat_steps(
-            self,
-            row: int,
-            col: int,
-            dirs: list[tuple[int, int]]
-    ) -> list[list[tuple[int, int]]]:
-        """
-        Find all one step and not beating steps
-
-        Parameters
-        ----------
-        row : int
-            0-indexed row number in the board
-        col : int
-            0-indexed column numer in the board
-        dirs : list[tuple[int, int]]
-            list of possible directions to a move
+        Get the list off all possible moves for current turn
 
         Returns
         -------
-        list[list[tuple[int, int]]]
-            list of lists of steps for each possible move
+        list[Move] | list[int]
+            list consist of the all possible moves for current turn,
+            packed if self.use_packed, [] if there are no moves
         """
 
-        res = []
-        for dir in dirs:
-            r1, c1 = row + dir[0], col + dir[1]
-            try:
-                cell = self.board.get_cell(r1, c1)
-            except IndexError:
-                continue
-            if cell == Cell.EMPTY:
-                res.append([(r1, c1)])
+        if self.use_packed:
+            return self.get_all_packed_moves()
 
-        return res
+        size = self.board.size
+        return [
+            Move.from_packed(packed, size)
+            for packed in self.get_all_packed_moves()
+        ]
 
-    def _get_dirs(self, row: int, col: int) -> list[tuple[int, int]]:
+    def get_all_packed_moves(self) -> list[int]:
         """
-        Find all possible directions for move for the checker.
-        It is consider that there is a checker in the cell!
+        Get the list off all possible moves for current turn
+        packed by the checkers.move.pack_move
 
-        Each directions represents diagonal step and is
-        pair of two ones with some signs. For example:
-        (1, -1) or (-1, -1).
-
-        Parameters
-        ----------
-        row : int
-            0-indexed row number in the board
-        col : int
-            0-indexed column numer in the board
+        Moves are cached by the Zobrist hash of the board and the turn,
+        so a recently seen position is not generated again.
 
         Returns
         -------
-        list[tuple[int, int]]
-            list of tuples of directions
+        list[int]
+            list consist of the all possible packed moves for current turn,
+            [] if there are no moves
         """
 
-        dirs = []
-        cell = self.board.get_cell(row, col)
-        if cell == Cell.BLACK:
-            dirs = [
-                (1, -1),
-                (1, 1),
-            ]
-        elif cell == Cell.WHITE:
-            dirs = [
-                (-1, -1),
-                (-1, 1),
-            ]
-        elif cell in (Cell.BLACK_QUEEN, Cell.WHITE_QUEEN):
-            dirs = [
-                (-1, -1),
-                (-1, 1),
-                (1, -1),
-                (1, 1),
-            ]
+        size = self.board.size
+        # the same side flag makes the key and generates the moves
+        black = self.turn == Color.BLACK
+        key = self.board.hash
+        if not black:
+            key ^= ZOBRIST_WHITE_TURN
+        # a hit in the game or in the shared cache moves the position
+        # to the end of the shared cache, so it is evicted last
+        moves = _moves_cache.pop((size, key), None)
+        if moves is None:
+            if key == self._cached_key:
+                moves = self._cached_moves
+            elif _engine is not None:
+                men, queens = self._own_by_type()
+                moves = tuple(_engine.gen_moves(
+                    size, men, queens, self._opponent(), black))
+            else:
+                moves = tuple(self._gen_packed_moves())
+            if len(_moves_cache) >= MOVES_CACHE_SIZE:
+                del _moves_cache[next(iter(_moves_cache))]
+        _moves_cache[size, key] = moves
+        self._cached_key, self._cached_moves = key, moves
 
-        return dirs
+        return list(moves)
 
-    def _get_beat_steps(self, row: int, col: int) -> list[Move]:
+    def _gen_packed_moves(self) -> list[int]:
         """
-        Find all possible beating steps for checker.
-        It is consider that there is a checker in the cell!
-
-        Parameters
-        ----------
-        row : int
-            0-indexed row number in the board
-        col : int
-            0-indexed column numer in the board
+        Pure Python version of the get_all_packed_moves
 
         Returns
         -------
-        list[list[tuple[int, int]]]
-            list of lists of steps for each possible move
+        list[int]
+            list consist of the all possible packed moves for current turn,
+            [] if there are no moves
         """
 
-        dirs = self._get_dirs(row, col)
-        steps = self._dfs_find_beat_steps(row, col, dirs, dirs)
-
-        return steps
+        men, queens = self._own_by_type()
+        return _core_bb.gen_moves(self.board.size, men, queens,
+                                  self._opponent(), self.turn == Color.BLACK)
 
-    def _get_not_beat_steps(self, row: int, col: int) -> list[Move]:
+    def _is_correct_cell_for_move(self, row: int, col: int) -> None:
         """
-        Find all possible not beating steps for checker.
-        It is consider that there is a checker in the cell!
+        If row or col are incorrect indices or checker in the cell
+        is not current turn's checker raises WrongMoveError.
 
         Parameters
         ----------
         row : int
             0-indexed row number in the board
         col : int
-            0-indexed column numer in the board
+            0-indexed column number in the board
 
         Returns
         -------
-        list[list[tuple[int, int]]]
-            list of lists of steps for each possible move
+        None
+
+        Raises
+        ------
+        WrongMoveError
+            when cell type does not correspond to turn or
+            row or col out of range(board.size)
         """
 
-        dirs = self._get_dirs(row, col)
-        steps = self._find_not_beat_steps(row, col, dirs)
+        if not 0 <= row < self.board.size \
+                or not 0 <= col < self.board.size:
+            raise WrongMoveError('row and col must be in the'
+                                 'range(self.board.size)')
 
-        return steps
+        if not self._is_turns_checker(1 << (row * self.board.size + col)):
+            raise WrongMoveError('cell type does not correspond turn\'s color')
 
 
 if __name__ == '__main__':
@@ -4,21 +4,120 @@ Move object consists of the start positions and sequence of the steps
 that should be done from oint to point/ Each step is a next position
 for checker.
 
+A move can also be packed into a single int. Cells of the board are
+indexed as row * size + col, bits [0:6] of the packed move are
+the start cell, bits [6:10] are the number of steps and each next
+6 bits are the cell of the next step.
+
 This file can also be imported as module and contains the following
 classes:
 
     * WrongMoveError - (Exception) exception for wrong move
     * Move - represents player's move.
+
+and the following functions:
+
+    * pack_move - packs the start cell and the step cells into an int
+    * unpack_start - start cell of the packed move
+    * unpack_len - number of steps of the packed move
+    * unpack_step - cell of the step of the packed move
+    * is_beat - whether the packed move beats opponent's checkers
 """
 
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Sequence
+
+
+SQUARE_BITS = 6
+SQUARE_MASK = (1 << SQUARE_BITS) - 1
+LENGTH_BITS = 4
+LENGTH_MASK = (1 << LENGTH_BITS) - 1
+STEPS_SHIFT = SQUARE_BITS + LENGTH_BITS
+# Maximum number of rows and columns of the board,
+# every cell index fits in SQUARE_BITS
+MAX_SIZE = 1 << SQUARE_BITS // 2
+# Shared (row, col) tuples of the packed steps row * MAX_SIZE + col,
+# so iterating over moves does not create new tuples
+_COORDS = tuple(divmod(i, MAX_SIZE) for i in range(MAX_SIZE * MAX_SIZE))
+
 
 class WrongMoveError(Exception):
     pass
 
 
+def pack_move(start: int, steps: Sequence[int]) -> int:
+    """
+    Pack the move into an int.
+
+    Parameters
+    ----------
+    start : int
+        index of the start cell
+    steps : Sequence[int]
+        indices of the cells of the steps
+
+    Returns
+    -------
+    int
+        packed move
+
+    Raises
+    ------
+    ValueError
+        when there are more than LENGTH_MASK steps
+    """
+
+    if len(steps) > LENGTH_MASK:
+        raise ValueError(f'move can not have more than {LENGTH_MASK} steps.')
+
+    packed = start | len(steps) << SQUARE_BITS
+    shift = STEPS_SHIFT
+    for step in steps:
+        packed |= step << shift
+        shift += SQUARE_BITS
+
+    return packed
+
+
+def unpack_start(packed: int) -> int:
+    """
+    Index of the start cell of the packed move.
+    """
+
+    return packed & SQUARE_MASK
+
+
+def unpack_len(packed: int) -> int:
+    """
+    Number of steps of the packed move.
+    """
+
+    return packed >> SQUARE_BITS & LENGTH_MASK
+
+
+def unpack_step(packed: int, i: int) -> int:
+    """
+    Index of the cell of the i-th (0-indexed) step of the packed move.
+    """
+
+    return packed >> (STEPS_SHIFT + SQUARE_BITS * i) & SQUARE_MASK
+
+
+def is_beat(packed: int, size: int) -> bool:
+    """
+    Check if the packed move for the board (size)x(size) beats
+    opponent's checkers, i.e. its first step goes over a row.
+    A move without steps does not beat.
+    """
+
+    if not packed >> SQUARE_BITS & LENGTH_MASK:
+        return False
+    row = (packed & SQUARE_MASK) // size
+    return not -1 <= (packed >> STEPS_SHIFT & SQUARE_MASK) // size - row <= 1
+
+
 class Move:
     """
     Class represents player's possible move.
@@ -26,27 +125,39 @@ class Move:
     Move is a sequence of steps for a single checker.
     Steps are tuples of two 0-indexed coordinates.
     Start is a current checker's coordinates.
-    For example start = (5, 0) and steps = [(4, 1), (2, 3)]
+    For example start = (5, 0) and steps = ((4, 1), (2, 3))
     means that cheker with coordinates (5, 0) goes (4, 1) and then go (2, 3).
 
+    Steps are kept packed in a single int, SQUARE_BITS bits
+    row * MAX_SIZE + col per step, so coordinates of the steps
+    must be in range(MAX_SIZE).
+
     Attributes
     ----------
     start :  tuple[int, int]
         initial checker's coordinates
-    steps : list[tuple[int, int]]
+    steps : tuple[tuple[int, int], ...]
         sequence of steps
 
     Methods
     -------
     add(step: tuple[int, int]) -> None:
-        Add step to the end of the list steps
+        Add step to the end of the steps
         First int in the step is a row, second - is a column
+    is_beat() -> bool:
+        Check if the move beats opponent's checkers
+    from_packed(packed: int, size: int) -> Move:
+        Create move from the packed move for the board (size)x(size)
+    to_packed(size: int) -> int:
+        Pack the move for the board (size)x(size)
     """
 
+    __slots__ = ('start', '_steps', '_len')
+
     def __init__(
             self,
             start: tuple[int, int],
-            steps: list[tuple[int, int]] = []):
+            steps: Iterable[tuple[int, int]] = ()):
         """
         Step is a tuple of two coordinates.
         Steps are sequence of steps in the move.
@@ -56,46 +167,108 @@ class Move:
         self.start = start
         self.steps = steps
 
-    def add(self, step: tuple[int, int]) -> None:
+    @property
+    def steps(self) -> tuple[tuple[int, int], ...]:
         """
-        Add step to the end of the list steps
-
-        First int in the step is a row, second - is a column
+        Sequence of steps
         """
 
-        self.steps.append(step)
+        return tuple(self)
+
+    @steps.setter
+    def steps(self, steps: Iterable[tuple[int, int]]) -> None:
+        self._steps = 0
+        self._len = 0
+        for step in steps:
+            self.add(step)
 
-    def __iter__(self) -> Move:
+    @classmethod
+    def from_packed(cls, packed: int, size: int) -> Move:
         """
-        Iterator goes through items of the steps.
+        Create move from the packed move for the board (size)x(size)
+
+        Parameters
+        ----------
+        packed : int
+            packed move
+        size : int
+            number of rows and columns of the board
+
+        Returns
+        -------
+        Move
         """
 
-        self.index = 0
-        return self
+        steps = [
+            divmod(unpack_step(packed, i), size)
+            for i in range(unpack_len(packed))
+        ]
+        return cls(divmod(unpack_start(packed), size), steps)
 
-    def __next__(self) -> tuple[int, int]:
+    def to_packed(self, size: int) -> int:
         """
-        Next item of the steps
+        Pack the move for the board (size)x(size)
+
+        Parameters
+        ----------
+        size : int
+            number of rows and columns of the board
 
         Returns
         -------
-        tuple[int, int]
+        int
+            packed move
+        """
+
+        return pack_move(
+            self.start[0] * size + self.start[1],
+            [row * size + col for row, col in self]
+        )
+
+    def add(self, step: tuple[int, int]) -> None:
+        """
+        Add step to the end of the steps
+
+        First int in the step is a row, second - is a column
 
         Raises
         ------
-        StopIteration
+        ValueError
+            when the row or the column is not in range(MAX_SIZE)
+        """
+
+        row, col = step
+        if not 0 <= row < MAX_SIZE or not 0 <= col < MAX_SIZE:
+            raise ValueError('row and col of the step must be '
+                             f'between 0 and {MAX_SIZE - 1}.')
+        self._steps |= (row * MAX_SIZE + col) << SQUARE_BITS * self._len
+        self._len += 1
+
+    def is_beat(self) -> bool:
+        """
+        Check if the move beats opponent's checkers,
+        i.e. its first step goes over a row.
+        A move without steps does not beat.
+        """
+
+        if not self._len:
+            return False
+        row = (self._steps & SQUARE_MASK) // MAX_SIZE
+        return not -1 <= row - self.start[0] <= 1
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """
+        Iterator goes through items of the steps.
         """
 
-        if self.index < len(self.steps):
-            result = self.steps[self.index]
-            self.index += 1
-            return result
-        else:
-            raise StopIteration
+        steps = self._steps
+        for _ in range(self._len):
+            yield _COORDS[steps & SQUARE_MASK]
+            steps >>= SQUARE_BITS
 
     def __str__(self):
         """
         String representation of the move.
         """
 
-        return f'start: {self.start}\tsteps: {self.steps}'
+        return f'start: {self.start}\tsteps: {list(self)}'
@@ -0,0 +1,243 @@
+"""This module is for generating moves of many positions at once.
+
+Positions are given as NumPy arrays of bitboards (see
+checkers.board.Board), one item per position. Checkers that can beat
+and checkers that can step are found for all positions together by
+shifting the arrays, so the Python code runs once per direction
+instead of once per position. Moves of the positions are generated by
+the compiled checkers._engine if it is built, else the pure Python
+generation starts only from the checkers found by beat_sources.
+It needs NumPy, which is installed with the batch extra:
+pip install english_checkers[batch].
+
+This file can also be imported as module and contains the following
+functions:
+
+    * beat_sources - bitboards of checkers that can beat
+    * step_sources - bitboards of checkers that can step
+    * gen_moves_batch - packed moves of every position
+"""
+
+
+import numpy as np
+
+from checkers import _core_bb
+from checkers.board import Board, MoveTables
+
+try:
+    from checkers import _engine
+except ImportError:
+    # pure Python move generation of checkers._core_bb is used
+    _engine = None
+
+
+def _shift(bb: np.ndarray, shift: int) -> np.ndarray:
+    """
+    Shift the bitboards by the change of the cell index,
+    bits that get out of the board are lost.
+    """
+
+    if shift > 0:
+        return bb << np.uint64(shift)
+    return bb >> np.uint64(-shift)
+
+
+def _movers(
+        d: int,
+        men: np.ndarray,
+        queens: np.ndarray,
+        black: np.ndarray,
+) -> np.ndarray:
+    """
+    Bitboards of the checkers that can go in the direction d.
+    """
+
+    if _core_bb.BLACK_DIRS & 1 << d:
+        return queens | np.where(black, men, np.uint64(0))
+    return queens | np.where(black, np.uint64(0), men)
+
+
+def _check(size: int, *bitboards: np.ndarray) -> MoveTables:
+    """
+    Check the board size and that the bitboards are uint64 arrays.
+
+    Raises
+    ------
+    ValueError
+        when size is not between 1 and Board.SIZE
+    TypeError
+        when a bitboards array has not the uint64 dtype
+    """
+
+    if not 1 <= size <= Board.SIZE:
+        raise ValueError(f'size must be between 1 and {Board.SIZE}.')
+    for bb in bitboards:
+        if bb.dtype != np.uint64:
+            raise TypeError('bitboards must be uint64 arrays.')
+
+    return MoveTables.get(size)
+
+
+def beat_sources(
+        size: int,
+        men: np.ndarray,
+        queens: np.ndarray,
+        opponent: np.ndarray,
+        black: np.ndarray,
+) -> np.ndarray:
+    """
+    Find checkers of the side to move that can beat
+    an opponent's checker in every position.
+
+    Parameters
+    ----------
+    size : int
+        number of rows and columns of the boards
+    men : np.ndarray
+        uint64 bitboards of the men of the side to move
+    queens : np.ndarray
+        uint64 bitboards of the queens of the side to move
+    opponent : np.ndarray
+        uint64 bitboards of the opponent's checkers
+    black : np.ndarray
+        True where black is the side to move
+
+    Returns
+    -------
+    np.ndarray
+        uint64 bitboards of the checkers that have beating moves
+
+    Raises
+    ------
+    ValueError
+        when size is not between 1 and Board.SIZE
+    TypeError
+        when a bitboards array has not the uint64 dtype
+    """
+
+    tables = _check(size, men, queens, opponent)
+    empty = np.uint64(tables.full) & ~(men | queens | opponent)
+
+    sources = np.zeros_like(men)
+    for d, shift in enumerate(tables.shifts):
+        bb = _movers(d, men, queens, black) & np.uint64(tables.jump_from[d])
+        bb = _shift(_shift(_shift(bb, shift) & opponent, shift) & empty,
+                    -2 * shift)
+        sources |= bb
+
+    return sources
+
+
+def step_sources(
+        size: int,
+        men: np.ndarray,
+        queens: np.ndarray,
+        opponent: np.ndarray,
+        black: np.ndarray,
+) -> np.ndarray:
+    """
+    Find checkers of the side to move that can step
+    to an empty cell in every position.
+
+    Parameters
+    ----------
+    size : int
+        number of rows and columns of the boards
+    men : np.ndarray
+        uint64 bitboards of the men of the side to move
+    queens : np.ndarray
+        uint64 bitboards of the queens of the side to move
+    opponent : np.ndarray
+        uint64 bitboards of the opponent's checkers
+    black : np.ndarray
+        True where black is the side to move
+
+    Returns
+    -------
+    np.ndarray
+        uint64 bitboards of the checkers that have not beating moves
+
+    Raises
+    ------
+    ValueError
+        when size is not between 1 and Board.SIZE
+    TypeError
+        when a bitboards array has not the uint64 dtype
+    """
+
+    tables = _check(size, men, queens, opponent)
+    empty = np.uint64(tables.full) & ~(men | queens | opponent)
+
+    sources = np.zeros_like(men)
+    for d, shift in enumerate(tables.shifts):
+        bb = _movers(d, men, queens, black) & np.uint64(tables.step_from[d])
+        sources |= _shift(_shift(bb, shift) & empty, -shift)
+
+    return sources
+
+
+def gen_moves_batch(
+        size: int,
+        men: np.ndarray,
+        queens: np.ndarray,
+        opponent: np.ndarray,
+        black: np.ndarray,
+) -> list[list[int]]:
+    """
+    Get the lists off all possible packed moves for the side to move
+    in every position.
+
+    Moves of every position are the same and in the same order as
+    checkers.game.Game.get_all_packed_moves returns.
+
+    Parameters
+    ----------
+    size : int
+        number of rows and columns of the boards
+    men : np.ndarray
+        uint64 bitboards of the men of the side to move
+    queens : np.ndarray
+        uint64 bitboards of the queens of the side to move
+    opponent : np.ndarray
+        uint64 bitboards of the opponent's checkers
+    black : np.ndarray
+        True where black is the side to move
+
+    Returns
+    -------
+    list[list[int]]
+        lists of packed moves, [] for a position without moves
+
+    Raises
+    ------
+    ValueError
+        when size is not between 1 and Board.SIZE
+    TypeError
+        when a bitboards array has not the uint64 dtype
+    """
+
+    tables = _check(size, men, queens, opponent)
+    positions = zip(men.tolist(), queens.tolist(), opponent.tolist(),
+                    black.tolist())
+    if _engine is not None:
+        gen_moves = _engine.gen_moves
+        return [gen_moves(size, *position) for position in positions]
+
+    beating = beat_sources(size, men, queens, opponent, black).tolist()
+    batch = []
+    for bb, (own_men, own_queens, opp, is_black) in zip(beating, positions):
+        men_dirs = _core_bb.BLACK_DIRS if is_black else _core_bb.WHITE_DIRS
+        empty = tables.full & ~(own_men | own_queens | opp)
+        moves = []
+        while bb:
+            lsb = bb & -bb
+            dirs = _core_bb.QUEEN_DIRS if lsb & own_queens else men_dirs
+            _core_bb.gen_beat_moves_at(tables, lsb.bit_length() - 1, dirs,
+                                       opp, empty | lsb, moves)
+            bb ^= lsb
+        if not moves:
+            _core_bb.gen_not_beat_moves(tables, own_men, own_queens,
+                                        men_dirs, empty, moves)
+        batch.append(moves)
+
+    return batch
@@ -0,0 +1,47 @@
+"""Helpers to build games for the tests from text layouts.
+
+A layout has one line per row of the board and one char per cell:
+'.' is an empty cell, 'b' and 'w' are black and white men,
+'B' and 'W' are black and white queens.
+"""
+
+from checkers.board import Board, Cell
+from checkers.game import Color, Game, GameState
+
+
+_CELLS = {
+    '.': Cell.EMPTY,
+    'b': Cell.BLACK,
+    'w': Cell.WHITE,
+    'B': Cell.BLACK_QUEEN,
+    'W': Cell.WHITE_QUEEN,
+}
+
+
+def board_from_str(layout: str) -> Board:
+    """
+    Build the board from the layout, its size is the number of rows.
+    """
+
+    rows = layout.split()
+    board = Board.blank(len(rows))
+    for row, line in enumerate(rows):
+        for col, char in enumerate(line):
+            cell = _CELLS[char]
+            if cell is not Cell.EMPTY:
+                board.set_cell(row, col, cell)
+
+    return board
+
+
+def game_from_str(
+        layout: str,
+        turn: Color = Color.BLACK,
+        state: GameState = GameState.UNFINISHED,
+) -> Game:
+    """
+    Build the game on the board from the layout, checkers counters
+    are counted on the board.
+    """
+
+    return Game.from_board(board_from_str(layout), turn, state)
@@ -13,40 +13,31 @@ class RandomAITestCase(unittest.TestCase):
     def tearDown(self) -> None:
         return super().tearDown()
 
+    def _moves(self) -> list[str]:
+        return [str(move) for move in self.game.get_all_moves()]
+
     def test_make_move_black_first_move(self) -> None:
-        ai_color = Color.BLACK
-        ai = RandomAI(self.size, ai_color)
-        move = ai.make_move()
+        ai = RandomAI(Color.BLACK)
+        board = str(self.game.board)
+        move = ai.make_move(self.game)
+        self.assertIn(str(move), self._moves())
+        self.assertEqual(str(self.game.board), board)
+        self.assertEqual(self.game.turn, Color.BLACK)
         self.game.make_move(move)
         self.assertEqual(self.game.turn, Color.WHITE)
-        self.assertEqual(ai._game.turn, Color.WHITE)
-        for row in range(self.size):
-            for col in range(self.size):
-                self.assertEqual(
-                    self.game.board.get_cell(row, col),
-                    ai._game.board.get_cell(row, col)
-                )
-        self.assertEqual(self.game.state, ai._game.state)
-        self.assertEqual(self.game.black_count, ai._game.black_count)
-        self.assertEqual(self.game.white_count, ai._game.white_count)
-        self.assertEqual(self.game.tie_counter, ai._game.tie_counter)
 
     def test_make_move_white_first_move(self) -> None:
-        ai_color = Color.WHITE
-        ai = RandomAI(self.size, ai_color)
+        ai = RandomAI(Color.WHITE)
         move = self.game.get_all_moves()[0]
         self.game.make_move(move)
-        move = ai.make_move(move)
+        move = ai.make_move(self.game)
+        self.assertIn(str(move), self._moves())
         self.game.make_move(move)
         self.assertEqual(self.game.turn, Color.BLACK)
-        self.assertEqual(ai._game.turn, Color.BLACK)
-        for row in range(self.size):
-            for col in range(self.size):
-                self.assertEqual(
-                    self.game.board.get_cell(row, col),
-                    ai._game.board.get_cell(row, col)
-                )
-        self.assertEqual(self.game.state, ai._game.state)
-        self.assertEqual(self.game.black_count, ai._game.black_count)
-        self.assertEqual(self.game.white_count, ai._game.white_count)
-        self.assertEqual(self.game.tie_counter, ai._game.tie_counter)
+        self.assertEqual(self.game.black_count, 12)
+        self.assertEqual(self.game.white_count, 12)
+
+    def test_make_move_seed(self) -> None:
+        first = RandomAI(Color.BLACK, seed=1).make_move(self.game)
+        second = RandomAI(Color.BLACK, seed=1).make_move(self.game)
+        self.assertEqual(str(first), str(second))
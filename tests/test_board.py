@@ -1,6 +1,6 @@
 import unittest
 
-from checkers.board import Board, Cell
+from checkers.board import Board, Cell, MoveTables
 
 
 class BoardTestCase(unittest.TestCase):
@@ -24,6 +24,9 @@ class BoardTestCase(unittest.TestCase):
         self.assertEqual(self.board6x6.get_cell(3, 2), Cell.BLACK_QUEEN)
         with self.assertRaises(IndexError):
             self.board6x6.set_cell(7, 11, Cell.EMPTY)
+        self.board6x6.set_cell(3, 2, 1)
+        self.assertEqual(self.board6x6.get_cell(3, 2), Cell.BLACK)
+        self.assertEqual(self.board6x6.hash, self.board6x6._zobrist_hash())
 
     def test___str__(self) -> None:
         expected = "|------|\n" \
@@ -32,3 +35,73 @@ class BoardTestCase(unittest.TestCase):
                    + "|__w __|\n" \
                    + "|------|\n"
         self.assertEqual(str(self.board3x3), expected)
+
+    def test_bitboards(self) -> None:
+        self.assertEqual(self.board3x3.black(), 1 << 1)
+        self.assertEqual(self.board3x3.white(), 1 << 7)
+        self.assertEqual(self.board3x3.occupied(), 1 << 1 | 1 << 7)
+        self.assertEqual(self.board3x3.empty(), 0b101111101)
+        self.board3x3.set_cell(0, 1, Cell.WHITE_QUEEN)
+        self.assertEqual(self.board3x3.black(), 0)
+        self.assertEqual(self.board3x3.white_queens, 1 << 1)
+
+    def test_clear(self) -> None:
+        self.board_default.clear()
+        self.assertEqual(self.board_default.occupied(), 0)
+        self.assertEqual(self.board_default.get_cell(0, 1), Cell.EMPTY)
+
+    def test_blank(self) -> None:
+        board = Board.blank(3)
+        self.assertEqual(board.size, 3)
+        self.assertEqual(board.occupied(), 0)
+        self.assertEqual(board.hash, 0)
+        board.set_cell(0, 1, Cell.BLACK)
+        self.board3x3.clear()
+        self.board3x3.set_cell(0, 1, Cell.BLACK)
+        self.assertEqual(board, self.board3x3)
+        self.assertEqual(Board.blank().size, Board.SIZE)
+        with self.assertRaises(ValueError):
+            Board.blank(Board.SIZE + 1)
+
+    def test_cell(self) -> None:
+        self.assertEqual(Cell.WHITE_QUEEN, 4)
+        self.assertEqual(Cell(3), Cell.BLACK_QUEEN)
+        self.assertEqual(str(Cell.BLACK), 'Cell.BLACK')
+
+    def test___eq__(self) -> None:
+        self.assertEqual(self.board3x3, Board(3))
+        self.assertNotEqual(self.board3x3, Board(4))
+        board = Board(3)
+        board.set_cell(0, 1, Cell.BLACK_QUEEN)
+        self.assertNotEqual(self.board3x3, board)
+        self.assertNotEqual(self.board3x3, str(self.board3x3))
+
+    def test___repr__(self) -> None:
+        self.assertEqual(repr(self.board3x3),
+                         f'Board(3)\n{self.board3x3}')
+
+    def test_move_tables(self) -> None:
+        tables = MoveTables.get(4)
+        self.assertIs(tables, MoveTables.get(4))
+        self.assertEqual(tables.full, 0xffff)
+        self.assertEqual(tables.dark, 0b0101101001011010)
+        self.assertEqual(tables.beats[1], ((3, 1 << 6, 1 << 11, 11),))
+        self.assertEqual(tables.shifts, (-5, -3, 3, 5))
+        self.assertEqual(tables.step_from, [0xeee0, 0x7770, 0x0eee, 0x0777])
+        self.assertEqual(tables.jump_from, [0xcc00, 0x3300, 0x00cc, 0x0033])
+
+    def test_hash(self) -> None:
+        initial = self.board6x6.hash
+        self.assertEqual(initial, self.board6x6._zobrist_hash())
+        self.board6x6.set_cell(0, 1, Cell.EMPTY)
+        self.board6x6.set_cell(3, 2, Cell.BLACK_QUEEN)
+        self.assertNotEqual(self.board6x6.hash, initial)
+        self.assertEqual(self.board6x6.hash, self.board6x6._zobrist_hash())
+        self.board6x6.set_cell(3, 2, Cell.EMPTY)
+        self.board6x6.set_cell(0, 1, Cell.BLACK)
+        self.assertEqual(self.board6x6.hash, initial)
+
+    def test_size(self) -> None:
+        self.assertEqual(self.board_default.size, Board.SIZE)
+        with self.assertRaises(ValueError):
+            Board(Board.SIZE + 1)
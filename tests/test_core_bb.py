@@ -0,0 +1,48 @@
+import unittest
+
+from checkers import _core_bb
+from checkers.board import Board, Cell
+from checkers.game import Color, Game, GameState
+from checkers.move import pack_move, unpack_start, unpack_step
+
+
+class CoreBBTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = Board(4)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        return super().tearDown()
+
+    def test_gen_moves(self) -> None:
+        self.assertEqual(
+            _core_bb.gen_moves(4, self.board.black_men, 0,
+                               self.board.white(), True),
+            [pack_move(1, [4]), pack_move(1, [6]), pack_move(3, [6])])
+
+    def test_gen_beat_moves_at(self) -> None:
+        self.board.clear()
+        self.board.set_cell(0, 1, Cell.BLACK_QUEEN)
+        self.board.set_cell(1, 2, Cell.WHITE)
+        self.board.set_cell(2, 1, Cell.WHITE)
+        moves = []
+        _core_bb.gen_beat_moves_at(
+            self.board.tables, 1, _core_bb.QUEEN_DIRS, self.board.white(),
+            self.board.empty() | 1 << 1, moves)
+        self.assertEqual(moves, [pack_move(1, [11])])
+
+    def test_beat_sources(self) -> None:
+        game = Game(4)
+        while game.state == GameState.UNFINISHED:
+            moves = game.get_all_packed_moves()
+            starts = {unpack_start(move) for move in moves
+                      if abs(unpack_step(move, 0) - unpack_start(move)) > 5}
+            men, queens = game._own_by_type()
+            men_dirs = (_core_bb.BLACK_DIRS if game.turn is Color.BLACK
+                        else _core_bb.WHITE_DIRS)
+            sources = _core_bb.beat_sources(
+                game.board.tables, men, queens, men_dirs, game._opponent(),
+                game.board.empty())
+            self.assertEqual(
+                {sq for sq in range(16) if sources >> sq & 1}, starts)
+            game.make_packed_move(moves[0])
@@ -0,0 +1,16 @@
+import random
+import unittest
+
+from checkers.game import Game, GameState, _engine
+
+
+@unittest.skipIf(_engine is None, 'checkers._engine is not built')
+class EngineTestCase(unittest.TestCase):
+    def test_gen_moves(self) -> None:
+        rng = random.Random(0)
+        for size in (3, 4, 6, 8):
+            game = Game(size)
+            while game.state == GameState.UNFINISHED:
+                moves = game.get_all_packed_moves()
+                self.assertEqual(moves, game._gen_packed_moves())
+                game.make_packed_move(rng.choice(moves))
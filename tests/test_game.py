@@ -1,7 +1,10 @@
 import unittest
+from unittest import mock
 
+from checkers import game as game_module
 from checkers.game import Game, GameState, Color
-from checkers.board import Cell
+from checkers.board import Board, Cell
+from checkers.move import Move, WrongMoveError, pack_move
 
 
 class GameTestCase(unittest.TestCase):
@@ -19,6 +22,47 @@ class GameTestCase(unittest.TestCase):
     def test__initial_black_count_2(self) -> None:
         self.assertEqual(self.game3._initial_black_count(), 1)
 
+    def test_update_checkers_counters(self) -> None:
+        black = {Cell.BLACK, Cell.BLACK_QUEEN}
+        white = {Cell.WHITE, Cell.WHITE_QUEEN}
+        for prev_cell in Cell:
+            for cell in Cell:
+                self.game.black_count = self.game.white_count = 5
+                self.game._update_checkers_counters(prev_cell, cell)
+                self.assertEqual(self.game.black_count,
+                                 5 + (cell in black) - (prev_cell in black))
+                self.assertEqual(self.game.white_count,
+                                 5 + (cell in white) - (prev_cell in white))
+
+    def test_tie_max(self) -> None:
+        self.assertEqual(self.game.tie_max, 8)
+        self.assertEqual(Game().tie_max, 32)
+
+    def test_color(self) -> None:
+        self.assertEqual(Color.BLACK, 1)
+        self.assertEqual(str(Color.WHITE), 'Color.WHITE')
+
+    def test_game_state(self) -> None:
+        self.assertEqual(GameState.UNFINISHED, 3)
+        self.assertEqual(str(GameState.TIE), 'GameState.TIE')
+
+    def test_from_board(self) -> None:
+        board = Board(4)
+        board.set_cell(0, 1, Cell.EMPTY)
+        game = Game.from_board(board, Color.WHITE)
+        self.assertIs(game.board, board)
+        self.assertEqual(game.turn, Color.WHITE)
+        self.assertEqual(game.state, GameState.UNFINISHED)
+        self.assertEqual(game.black_count, 1)
+        self.assertEqual(game.white_count, 2)
+        self.assertEqual(game.tie_max, 8)
+        self.assertEqual(game.get_all_moves()[0].start, (3, 0))
+        game = Game.from_board(Board(4), 2, 3)
+        self.assertIs(game.turn, Color.WHITE)
+        self.assertIs(game.state, GameState.UNFINISHED)
+        with self.assertRaises(ValueError):
+            Game.from_board(Board(4), 3)
+
     def test_opponent(self) -> None:
         self.assertIsInstance(self.game.opponent(), Color)
         self.assertEqual(self.game.opponent(), Color.WHITE)
@@ -29,7 +73,7 @@ class GameTestCase(unittest.TestCase):
         self.assertEqual(len(moves), 3)
         self.assertIsInstance(moves[0].start, tuple)
         self.assertEqual(moves[0].start, (0, 1))
-        self.assertIsInstance(moves[0].steps, list)
+        self.assertIsInstance(moves[0].steps, tuple)
         self.assertEqual(len(moves[0].steps), 1)
         self.assertIsInstance(moves[0].steps[0], tuple)
         self.assertEqual(moves[0].steps[0], (1, 0))
@@ -38,6 +82,47 @@ class GameTestCase(unittest.TestCase):
         self.assertEqual(moves[1].steps[0], (1, 2))
         self.assertEqual(moves[2].steps[0], (1, 2))
 
+    def test_get_all_packed_moves(self) -> None:
+        packed = self.game.get_all_packed_moves()
+        moves = self.game.get_all_moves()
+        self.assertEqual(packed, [move.to_packed(4) for move in moves])
+
+    def test_get_all_packed_moves_cache(self) -> None:
+        moves = self.game.get_all_packed_moves()
+        moves.append(0)
+        self.assertEqual(self.game.get_all_packed_moves(), moves[:-1])
+        self.game.make_packed_move(moves[0])
+        self.assertEqual(self.game.get_all_packed_moves(),
+                         self.game._gen_packed_moves())
+
+    def test_moves_cache_lru(self) -> None:
+        with mock.patch.object(game_module, 'MOVES_CACHE_SIZE', 2), \
+                mock.patch.dict(game_module._moves_cache, clear=True):
+            Game(4).get_all_packed_moves()
+            Game(3).get_all_packed_moves()
+            Game(4).get_all_packed_moves()
+            Game(6).get_all_packed_moves()
+            self.assertEqual([size for size, _ in game_module._moves_cache],
+                             [4, 6])
+            # a hit in the game itself refreshes the position too
+            game = Game(3)
+            game.get_all_packed_moves()
+            Game(4).get_all_packed_moves()
+            game.get_all_packed_moves()
+            Game(6).get_all_packed_moves()
+            self.assertEqual([size for size, _ in game_module._moves_cache],
+                             [3, 6])
+
+    def test_moves_cache_int_turn(self) -> None:
+        with mock.patch.dict(game_module._moves_cache, clear=True):
+            game = Game(8)
+            game.turn = 1
+            self.assertEqual(game.get_all_moves()[0].start[0], 2)
+            game = Game(8)
+            move = game.get_all_moves()[0]
+            self.assertEqual(move.start[0], 2)
+            game.make_move(move)
+
     def test_make_move_1(self) -> None:
         moves = self.game.get_all_moves()
         move = moves[0]
@@ -69,11 +154,65 @@ class GameTestCase(unittest.TestCase):
         self.assertEqual(self.game3.black_count, 1)
         self.assertEqual(self.game3.white_count, 1)
 
+    def test_use_packed(self) -> None:
+        game = Game(4, use_packed=True)
+        while game.state == GameState.UNFINISHED:
+            moves = game.get_all_moves()
+            self.assertEqual(moves, self.game.get_all_packed_moves())
+            game.make_move(moves[0])
+            self.game.make_move(self.game.get_all_moves()[0])
+        self.assertEqual(game.state, self.game.state)
+        with self.assertRaises(WrongMoveError):
+            Game(4, use_packed=True).make_move(pack_move(12, [9]))
+        with self.assertRaises(WrongMoveError):
+            Game(4, use_packed=True).make_move(pack_move(1, []))
+        with self.assertRaises(WrongMoveError):
+            Game(4, use_packed=True).make_move(pack_move(1, [21]))
+
+    def test_update_state_no_checkers(self) -> None:
+        self.game.board.clear()
+        self.game.board.set_cell(1, 2, Cell.BLACK)
+        self.game.board.set_cell(2, 1, Cell.WHITE)
+        self.game.black_count = self.game.white_count = 1
+        self.game.turn = Color.WHITE
+        with mock.patch.object(self.game, 'get_all_packed_moves') as gen:
+            self.game.make_packed_move(pack_move(9, [3]))
+        gen.assert_not_called()
+        self.assertEqual(self.game.state, GameState.WHITE_WON)
+        self.assertEqual(self.game.board.get_cell(0, 3), Cell.WHITE_QUEEN)
+
+    def test_make_move_wrong(self) -> None:
+        with self.assertRaises(WrongMoveError):
+            self.game.make_move(Move((3, 0), [(2, 1)]))
+        with self.assertRaises(WrongMoveError):
+            self.game.make_move(Move((4, 1), [(5, 2)]))
+        with self.assertRaises(WrongMoveError):
+            self.game.make_move(Move((-1, 5), [(1, 0)]))
+        with self.assertRaises(WrongMoveError):
+            self.game.make_move(Move((0, 1)))
+        with self.assertRaises(WrongMoveError):
+            self.game.make_move(Move((0, 1), [(1, 5)]))
+        self.assertEqual(self.game.turn, Color.BLACK)
+        self.assertEqual(self.game._undo_ends, [])
+
     def test_undo_1(self) -> None:
         self.game.undo()
         self.assertEqual(self.game.turn, Color.BLACK)
         self.assertEqual(self.game.state, GameState.UNFINISHED)
 
+    def test_undo_all(self) -> None:
+        initial = Game(4).board
+        while self.game.state == GameState.UNFINISHED:
+            self.game.make_packed_move(self.game.get_all_packed_moves()[-1])
+        while self.game._undo_ends:
+            self.game.undo()
+
+        self.assertEqual(self.game._undo_buf, bytearray())
+        self.assertEqual(self.game.board.hash, initial.hash)
+        self.assertEqual(self.game.board.occupied(), initial.occupied())
+        self.assertEqual(self.game.black_count, 2)
+        self.assertEqual(self.game.white_count, 2)
+
     def test_undo_2(self) -> None:
         while self.game.state == GameState.UNFINISHED:
             moves = self.game.get_all_moves()
@@ -1,29 +1,57 @@
+import copy
 import unittest
 
-from checkers.move import Move
+from checkers.move import (
+    Move,
+    is_beat,
+    pack_move,
+    unpack_len,
+    unpack_start,
+    unpack_step,
+)
+
+
+_EXPECTED_STEPS = ((5, 6), (7, 4))
 
 
 class MoveTestCase(unittest.TestCase):
-    def setUp(self) -> None:
-        self.move = Move((3, 4), [(5, 6), (7, 4)])
-        return super().setUp()
+    @classmethod
+    def setUpClass(cls) -> None:
+        # shared by all tests, tests that change the move use a copy
+        cls.move = Move((3, 4), _EXPECTED_STEPS)
+        return super().setUpClass()
 
     def tearDown(self) -> None:
         return super().tearDown()
 
     def test_add(self) -> None:
-        self.move.add((5, 2))
-        self.assertEqual(self.move.steps[-1], (5, 2))
+        move = copy.copy(self.move)
+        move.add((5, 2))
+        self.assertEqual(move.steps[-1], (5, 2))
+        self.assertEqual(len(self.move.steps), 2)
+
+    def test_add_wrong(self) -> None:
+        with self.assertRaises(ValueError):
+            copy.copy(self.move).add((8, 1))
+        with self.assertRaises(ValueError):
+            Move((0, 1), [(1, -1)])
+
+    def test_set_steps(self) -> None:
+        move = copy.copy(self.move)
+        move.steps = [(2, 3)]
+        self.assertEqual(move.steps, ((2, 3),))
+        self.assertEqual(move.start, (3, 4))
 
     def test___iter__(self) -> None:
-        steps = [(5, 6), (7, 4)]
         for i, step in enumerate(self.move):
-            self.assertEqual(step, steps[i])
+            self.assertEqual(step, _EXPECTED_STEPS[i])
+
+    def test___iter___shared_steps(self) -> None:
+        self.assertIs(next(iter(self.move)), next(iter(self.move)))
 
     def test___next__(self) -> None:
         move_it = iter(self.move)
-        steps = [(5, 6), (7, 4)]
-        steps_it = iter(steps)
+        steps_it = iter(_EXPECTED_STEPS)
         self.assertEqual(next(move_it), next(steps_it))
         self.assertEqual(next(move_it), next(steps_it))
         with self.assertRaises(StopIteration):
@@ -32,3 +60,38 @@ class MoveTestCase(unittest.TestCase):
     def test___str__(self) -> None:
         str_move = 'start: (3, 4)\tsteps: [(5, 6), (7, 4)]'
         self.assertEqual(str(self.move), str_move)
+
+    def test_default_steps(self) -> None:
+        move = Move((0, 1))
+        move.add((1, 2))
+        self.assertEqual(move.steps, ((1, 2),))
+        self.assertEqual(Move((0, 1)).steps, ())
+
+    def test_pack_move(self) -> None:
+        packed = pack_move(28, [46, 60])
+        self.assertEqual(unpack_start(packed), 28)
+        self.assertEqual(unpack_len(packed), 2)
+        self.assertEqual(unpack_step(packed, 0), 46)
+        self.assertEqual(unpack_step(packed, 1), 60)
+        self.assertEqual(unpack_len(pack_move(1, [1] * 15)), 15)
+        with self.assertRaises(ValueError):
+            pack_move(1, [1] * 16)
+
+    def test_to_packed(self) -> None:
+        packed = self.move.to_packed(8)
+        self.assertEqual(packed, pack_move(28, [46, 60]))
+        move = Move.from_packed(packed, 8)
+        self.assertEqual(move.start, self.move.start)
+        self.assertEqual(move.steps, self.move.steps)
+
+    def test_is_beat(self) -> None:
+        self.assertTrue(self.move.is_beat())
+        self.assertFalse(Move((3, 4), [(4, 5)]).is_beat())
+        self.assertTrue(is_beat(self.move.to_packed(8), 8))
+        self.assertTrue(is_beat(pack_move(19, [1]), 8))
+        self.assertFalse(is_beat(pack_move(10, [1]), 8))
+        self.assertFalse(is_beat(pack_move(4, [8]), 3))
+        self.assertFalse(Move((2, 1)).is_beat())
+        move = Move((0, 1), [(3, 4)])
+        self.assertEqual(move.is_beat(), is_beat(move.to_packed(8), 8))
+        self.assertFalse(is_beat(pack_move(17, []), 8))
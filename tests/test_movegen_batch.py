@@ -0,0 +1,80 @@
+import random
+import unittest
+from unittest import mock
+
+from checkers.board import MoveTables
+from checkers.game import Color, Game, GameState
+
+try:
+    import numpy as np
+    from checkers import movegen_batch
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class MovegenBatchTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(0)
+        self.games = []
+        for size in (4, 6, 8):
+            game = Game(size, use_packed=True)
+            positions = []
+            while game.state == GameState.UNFINISHED:
+                positions.append(self._position(game))
+                game.make_move(rng.choice(game.get_all_moves()))
+            positions.append(self._position(game))
+            self.games.append((size, positions))
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        return super().tearDown()
+
+    @staticmethod
+    def _position(game: Game) -> tuple[int, int, int, bool, list[int]]:
+        men, queens = game._own_by_type()
+        return (men, queens, game._opponent(), game.turn is Color.BLACK,
+                game.get_all_packed_moves())
+
+    @staticmethod
+    def _arrays(positions):
+        men, queens, opponent, black, _ = zip(*positions)
+        return (np.array(men, dtype=np.uint64),
+                np.array(queens, dtype=np.uint64),
+                np.array(opponent, dtype=np.uint64),
+                np.array(black, dtype=bool))
+
+    def test_gen_moves_batch(self) -> None:
+        for size, positions in self.games:
+            batch = movegen_batch.gen_moves_batch(
+                size, *self._arrays(positions))
+            self.assertEqual(batch, [moves for *_, moves in positions])
+
+    def test_gen_moves_batch_pure_python(self) -> None:
+        with mock.patch.object(movegen_batch, '_engine', None):
+            self.test_gen_moves_batch()
+
+    def test_sources(self) -> None:
+        for size, positions in self.games:
+            arrays = self._arrays(positions)
+            beating = movegen_batch.beat_sources(size, *arrays)
+            stepping = movegen_batch.step_sources(size, *arrays)
+            for i, (*_, moves) in enumerate(positions):
+                starts = 0
+                for move in moves:
+                    starts |= 1 << (move & 0b111111)
+                if beating[i]:
+                    self.assertEqual(int(beating[i]), starts)
+                else:
+                    self.assertEqual(int(stepping[i]), starts)
+
+    def test_wrong_arguments(self) -> None:
+        bb = np.zeros(1, dtype=np.uint64)
+        with self.assertRaises(ValueError):
+            movegen_batch.beat_sources(9, bb, bb, bb, bb.astype(bool))
+        with self.assertRaises(ValueError):
+            movegen_batch.gen_moves_batch(9, bb, bb, bb, bb.astype(bool))
+        self.assertNotIn(9, MoveTables._cache)
+        with self.assertRaises(TypeError):
+            movegen_batch.step_sources(8, bb.astype(np.int64), bb, bb,
+                                       bb.astype(bool))